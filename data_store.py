@@ -1,28 +1,86 @@
 """Data persistence layer for the wrist device."""
+import asyncio
 import json
 import os
+import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, List, Any, Awaitable, Callable, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 DATA_FILE = "watch_data.json"
+SAVE_DELAY = 0.25  # seconds to coalesce auto-save bursts into one write
+
+
+def _dumps(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, compact unless ``pretty``."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(',', ':')).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings; other JSON values (null, numbers) pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 class DataStore:
     """Manages persistent storage of device data."""
 
-    def __init__(self, filepath: str = DATA_FILE):
+    def __init__(self, filepath: str = DATA_FILE,
+                 scheduler: Optional[Callable[[float, Callable[[], Awaitable[None]]], Any]] = None):
+        """Create a store backed by ``filepath``.
+
+        ``scheduler(delay, callback)`` defers auto-saves; ``callback`` is a
+        coroutine function (Textual's ``set_timer`` accepts these). Without a
+        scheduler every change is saved immediately.
+        """
         self.filepath = filepath
+        self._scheduler = scheduler
+        self._dirty = False
+        self._flush_handle = None
+        self._write_lock = threading.Lock()
+        self._version = 0
+        self._inv_version = 0
         self._data = self._load()
+        self._bind_data()
 
     def _load(self) -> Dict[str, Any]:
         """Load data from JSON file or create defaults."""
-        if os.path.exists(self.filepath):
+        try:
+            # One unbuffered read of the whole (small) file
+            fd = os.open(self.filepath, os.O_RDONLY)
             try:
-                with open(self.filepath, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return self._default_data()
+                raw = os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+            return _loads(raw)
+        except (ValueError, OSError):
+            return self._default_data()
+
+    def _bind_data(self) -> None:
+        """Refresh caches derived from the loaded data."""
+        # Intern keys parsed from JSON so lookups by literal names hit the
+        # identity fast path in dict probing
+        for section in ("stats", "settings"):
+            self._data[section] = {sys.intern(k): v for k, v in self._data.get(section, {}).items()}
+        self._auto_save = bool(self._data["settings"].get("auto_save", True))
+        self._stats = self._data["stats"]
+        self._load_inventory()
 
     def _default_data(self) -> Dict[str, Any]:
         """Return default data structure."""
@@ -63,81 +121,223 @@ class DataStore:
 
     def save(self) -> None:
         """Save current data to JSON file."""
+        self._write_bytes(self._serialize())
+
+    async def asave(self) -> None:
+        """Save current data without blocking the event loop on disk I/O."""
+        payload = self._serialize()
+        await asyncio.to_thread(self._write_bytes, payload)
+
+    def export_pretty(self, path: str) -> None:
+        """Write an indented, human-readable copy of the data to ``path``."""
+        with open(path, 'wb') as f:
+            f.write(_dumps(self._document(), pretty=True))
+
+    def _serialize(self) -> bytes:
+        """Stamp and encode the current data, clearing the dirty flag."""
+        self._dirty = False
         self._data["last_updated"] = datetime.now().isoformat()
-        with open(self.filepath, 'w') as f:
-            json.dump(self._data, f, indent=2)
+        return _dumps(self._document())
+
+    def _document(self) -> Dict[str, Any]:
+        """Return the data in its on-disk JSON shape."""
+        return {**self._data, "inventory": self.inventory}
+
+    def _write_bytes(self, payload: bytes) -> None:
+        # Write to a sibling temp file and rename over the target so a crash
+        # mid-write never leaves a truncated data file behind.
+        tmp_path = self.filepath + ".tmp"
+        with self._write_lock:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+
+    def _mark_dirty(self) -> None:
+        """Schedule a deferred save, coalescing bursts of mutations."""
+        if self._scheduler is None:
+            self.save()
+            return
+        self._dirty = True
+        if self._flush_handle is None:
+            self._flush_handle = self._scheduler(SAVE_DELAY, self.aflush)
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if any."""
+        self._flush_handle = None
+        if self._dirty:
+            self.save()
+
+    async def aflush(self) -> None:
+        """Write pending changes to disk from a worker thread, if any."""
+        self._flush_handle = None
+        if self._dirty:
+            await self.asave()
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation, for cheap change detection."""
+        return self._version
+
+    @property
+    def inventory_version(self) -> int:
+        """Counter bumped only when the inventory changes."""
+        return self._inv_version
 
     # Stats accessors
     @property
     def stats(self) -> Dict[str, int]:
-        return self._data.get("stats", {})
+        return self._stats
 
     def get_stat(self, name: str) -> int:
-        return self.stats.get(name, 0)
+        return self._stats.get(name, 0)
 
     def set_stat(self, name: str, value: int) -> None:
-        self._data["stats"][name] = max(0, min(100, value))
-        if self._data["settings"].get("auto_save", True):
-            self.save()
+        self._stats[name] = value if 0 <= value <= 100 else (0 if value < 0 else 100)
+        self._version += 1
+        if self._auto_save:
+            self._mark_dirty()
 
     def update_stat(self, name: str, delta: int) -> None:
         current = self.get_stat(name)
         self.set_stat(name, current + delta)
 
     # Inventory accessors
+    #
+    # Items are held as parallel per-field lists (names[i], categories[i], ...)
+    # with a lowercase name -> position index; the JSON file keeps the list of
+    # item dicts, which is rebuilt on demand.
     @property
     def inventory(self) -> List[Dict[str, Any]]:
-        return self._data.get("inventory", [])
+        return [
+            {"name": n, "category": c, "quantity": q, "weight": w}
+            for n, c, q, w in self.inventory_rows()
+        ]
+
+    @property
+    def item_names(self) -> List[str]:
+        return self._names
+
+    def inventory_rows(self, limit: Optional[int] = None) -> Iterator[Tuple[str, str, int, float]]:
+        """Iterate (name, category, quantity, weight) rows, optionally only the first ``limit``."""
+        return islice(zip(self._names, self._categories, self._quantities, self._weights), limit)
 
     def add_item(self, name: str, category: str, quantity: int, weight: float) -> None:
         """Add a new EDC item or update an existing one."""
-        for item in self._data["inventory"]:
-            if item["name"].lower() == name.lower():
-                item["category"] = category
-                item["quantity"] = quantity
-                item["weight"] = weight
-                if self._data["settings"].get("auto_save", True):
-                    self.save()
-                return
-        self._data["inventory"].append({
-            "name": name,
-            "category": category,
-            "quantity": quantity,
-            "weight": weight
-        })
-        if self._data["settings"].get("auto_save", True):
-            self.save()
+        category = _intern(category)
+        i = self._inv_index.get(name.lower())
+        if i is not None:
+            self._categories[i] = category
+            self._quantities[i] = quantity
+            self._weights[i] = weight
+        else:
+            self._inv_index[name.lower()] = len(self._names)
+            self._names.append(name)
+            self._categories.append(category)
+            self._quantities.append(quantity)
+            self._weights.append(weight)
+        self._version += 1
+        self._inv_version += 1
+        if self._auto_save:
+            self._mark_dirty()
 
     def update_item(self, original_name: str, name: str, category: str, quantity: int, weight: float) -> bool:
-        """Update an existing item by name."""
-        for item in self._data["inventory"]:
-            if item["name"] == original_name:
-                item["name"] = name
-                item["category"] = category
-                item["quantity"] = quantity
-                item["weight"] = weight
-                if self._data["settings"].get("auto_save", True):
-                    self.save()
-                return True
-        return False
+        """Update an existing item by name.
+
+        Returns False if the item does not exist or another item already
+        uses the new name.
+        """
+        i = self._find_item(original_name)
+        if i is None:
+            return False
+        category = _intern(category)
+        old_key, new_key = original_name.lower(), name.lower()
+        # Refuse to rename onto another item's name
+        if new_key != old_key:
+            if new_key in self._inv_index:
+                return False
+        elif name != original_name and self._find_item(name) is not None:
+            return False
+        self._names[i] = name
+        self._categories[i] = category
+        self._quantities[i] = quantity
+        self._weights[i] = weight
+        if new_key != old_key:
+            self._index_inventory()
+        self._version += 1
+        self._inv_version += 1
+        if self._auto_save:
+            self._mark_dirty()
+        return True
 
     def remove_item(self, name: str) -> bool:
         """Remove an item by name."""
-        for item in self._data["inventory"]:
-            if item["name"] == name:
-                self._data["inventory"].remove(item)
-                if self._data["settings"].get("auto_save", True):
-                    self.save()
-                return True
-        return False
+        i = self._find_item(name)
+        if i is None:
+            return False
+        self._remove_at(i)
+        self._version += 1
+        self._inv_version += 1
+        if self._auto_save:
+            self._mark_dirty()
+        return True
 
     def get_item(self, name: str) -> Optional[Dict[str, Any]]:
         """Get an item by name."""
-        for item in self._data["inventory"]:
-            if item["name"] == name:
-                return item
+        i = self._find_item(name)
+        if i is None:
+            return None
+        return {
+            "name": self._names[i],
+            "category": self._categories[i],
+            "quantity": self._quantities[i],
+            "weight": self._weights[i]
+        }
+
+    def _find_item(self, name: str) -> Optional[int]:
+        """Return the position of the item named exactly ``name``."""
+        i = self._inv_index.get(name.lower())
+        if i is None or self._names[i] == name:
+            return i
+        # Older data files may hold names differing only in case; the index
+        # points at the first of them, so scan for the exact match
+        for j, other in enumerate(self._names):
+            if other == name:
+                return j
         return None
 
+    def _remove_at(self, i: int) -> None:
+        """Pop position ``i`` and shift only the index entries after it."""
+        index = self._inv_index
+        key = self._names[i].lower()
+        if index.get(key) == i:
+            del index[key]
+        self._names.pop(i)
+        self._categories.pop(i)
+        self._quantities.pop(i)
+        self._weights.pop(i)
+        for j in range(i, len(self._names)):
+            key = self._names[j].lower()
+            pos = index.get(key)
+            if pos is None or pos == j + 1:
+                index[key] = j
+
+    def _load_inventory(self) -> None:
+        """Split the stored item dicts into per-field lists."""
+        items = self._data.pop("inventory", [])
+        self._names = [item["name"] for item in items]
+        self._categories = [_intern(item.get("category", "Uncategorized")) for item in items]
+        self._quantities = [item.get("quantity", 1) for item in items]
+        self._weights = [item.get("weight", 0.0) for item in items]
+        self._index_inventory()
+
+    def _index_inventory(self) -> None:
+        """Rebuild the case-insensitive name -> first position lookup table."""
+        self._inv_index = {}
+        for i, name in enumerate(self._names):
+            self._inv_index.setdefault(name.lower(), i)
+
     # Settings accessors
     @property
     def settings(self) -> Dict[str, Any]:
@@ -148,20 +348,27 @@ class DataStore:
 
     def set_setting(self, key: str, value: Any) -> None:
         self._data["settings"][key] = value
-        if self._data["settings"].get("auto_save", True):
-            self.save()
+        if key == "auto_save":
+            self._auto_save = bool(value)
+        self._version += 1
+        if self._auto_save:
+            self._mark_dirty()
 
     def reset_stats(self) -> None:
         """Reset all stats to default values."""
-        self._data["stats"] = {
+        self._stats = self._data["stats"] = {
             "hydration": 75,
             "energy": 80,
             "urination": 30,
             "stress": 25
         }
+        self._version += 1
         self.save()
 
     def reset_all(self) -> None:
         """Reset everything to defaults."""
         self._data = self._default_data()
+        self._bind_data()
+        self._version += 1
+        self._inv_version += 1
         self.save()
\ No newline at end of file
@@ -2,7 +2,9 @@
 WristComp - A Pip-Boy style smartwatch terminal application.
 A compact, retro-digital interface for tracking personal stats and inventory.
 """
-from datetime import datetime
+import re
+import time
+from functools import lru_cache
 from typing import Optional
 
 from textual.app import App, ComposeResult
@@ -29,16 +31,46 @@ from data_store import DataStore
 # UTILITY WIDGETS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Every possible 10-segment bar, indexed by filled segment count
+_BAR10 = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+
+def _bar(percent: int) -> str:
+    """Return the 10-segment bar for a 0-100 percentage."""
+    return _BAR10[min(max(int(percent), 0), 100) // 10]
+
+
+@lru_cache(maxsize=256)
+def _render_battery(level: int) -> str:
+    return f"[b]BAT[/b] [{_bar(level)}] {level}%"
+
+
+@lru_cache(maxsize=512)
+def _render_statbar(label: str, icon: str, value: int, color: str) -> str:
+    return f"{icon} [b]{label}[/b] [{color}]{_bar(value)}[/{color}] {value}%"
+
+
+_INT_RE = re.compile(r"[-+]?\d+")
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def _parse_int(text: str, default: int) -> int:
+    text = text.strip()
+    return int(text) if _INT_RE.fullmatch(text) else default
+
+
+def _parse_float(text: str, default: float) -> float:
+    text = text.strip()
+    return float(text) if _FLOAT_RE.fullmatch(text) else default
+
+
 class BatteryIndicator(Static):
     """Simulated battery level indicator."""
     
     battery_level = reactive(87)
     
     def render(self) -> str:
-        bars = int(self.battery_level / 10)
-        empty = 10 - bars
-        bar_str = "█" * bars + "░" * empty
-        return f"[b]BAT[/b] [{bar_str}] {self.battery_level}%"
+        return _render_battery(self.battery_level)
 
 
 class ClockDisplay(Static):
@@ -46,13 +78,9 @@ class ClockDisplay(Static):
     
     def on_mount(self) -> None:
         self.update_clock()
-        self.set_interval(1, self.update_clock)
     
     def update_clock(self) -> None:
-        now = datetime.now()
-        time_str = now.strftime("%H:%M:%S")
-        date_str = now.strftime("%Y-%m-%d")
-        self.update(f"[b]{time_str}[/b]\n[dim]{date_str}[/dim]")
+        self.update(time.strftime("[b]%H:%M:%S[/b]\n[dim]%Y-%m-%d[/dim]", time.localtime()))
 
 
 class StatBar(Static):
@@ -64,12 +92,10 @@ class StatBar(Static):
         self.icon = icon
         self.value = value
         self.color = color
+        self._label = name.upper()[:4]
     
     def render(self) -> str:
-        bar_len = 10
-        filled = int(self.value / 100 * bar_len)
-        bar = "█" * filled + "░" * (bar_len - filled)
-        return f"{self.icon} [b]{self.stat_name.upper()[:4]}[/b] [{self.color}]{bar}[/{self.color}] {self.value}%"
+        return _render_statbar(self._label, self.icon, self.value, self.color)
 
 
 class DeviceFrame(Container):
@@ -105,6 +131,14 @@ class DashboardScreen(Screen):
         ("q", "app_quit", "Quit"),
     ]
     
+    STAT_BARS = [
+        ("hydration", "💧", "cyan"),
+        ("energy", "⚡", "yellow"),
+        ("urination", "🚻", "blue"),
+        ("stress", "😰", "red"),
+    ]
+    PREVIEW_ITEMS = 3
+    
     def action_switch_screen(self, screen_name: str) -> None:
         self.app.action_switch_screen(screen_name)
 
@@ -113,11 +147,19 @@ class DashboardScreen(Screen):
 
     def on_screen_resume(self) -> None:
         """Refresh when returning to this screen."""
-        self.refresh(recompose=True)
+        self.refresh_stats()
     
     def compose(self) -> ComposeResult:
         store = self.app.store  # type: ignore
         stats = store.stats
+        self._last_version = store.version
+        self._seen_inv_version = store.inventory_version
+        self._stat_bars = {
+            name: StatBar(name, icon, stats.get(name, 0), color)
+            for name, icon, color in self.STAT_BARS
+        }
+        self._inv_lines = [Static("") for _ in range(self.PREVIEW_ITEMS)]
+        self._update_inventory_preview(store)
         
         yield Container(
             # Header row: Title + Clock + Battery
@@ -131,17 +173,14 @@ class DashboardScreen(Screen):
             # Main stats display
             Container(
                 Static("[b]STATUS MONITOR[/b]", classes="section-title"),
-                StatBar("hydration", "💧", stats.get("hydration", 0), "cyan"),
-                StatBar("energy", "⚡", stats.get("energy", 0), "yellow"),
-                StatBar("urination", "🚻", stats.get("urination", 0), "blue"),
-                StatBar("stress", "😰", stats.get("stress", 0), "red"),
+                *self._stat_bars.values(),
                 classes="stats-container"
             ),
             
             # Quick inventory preview
             Container(
                 Static("[b]INVENTORY[/b]", classes="section-title"),
-                *self._inventory_items(store),
+                *self._inv_lines,
                 classes="inventory-preview"
             ),
             
@@ -152,17 +191,31 @@ class DashboardScreen(Screen):
         )
     
     def _inventory_items(self, store) -> list:
-        items = store.inventory[:3]  # Show first 3 items
-        if not items:
-            return [Static("[dim]No items[/dim]")]
-        return [Static(f"• {item['name']} x{item['quantity']}") for item in items]
-    
-    def on_mount(self) -> None:
-        self.set_interval(2, self.refresh_stats)
+        lines = [f"• {name} x{quantity}" for name, _, quantity, _ in store.inventory_rows(self.PREVIEW_ITEMS)]
+        return lines or ["[dim]No items[/dim]"]
+    
+    def _update_inventory_preview(self, store) -> None:
+        """Reuse the pooled preview lines, hiding any that are unused."""
+        lines = self._inventory_items(store)
+        for i, widget in enumerate(self._inv_lines):
+            if i < len(lines):
+                widget.update(lines[i])
+                widget.display = True
+            else:
+                widget.display = False
     
     def refresh_stats(self) -> None:
-        """Refresh the stats display."""
-        self.refresh(recompose=True)
+        """Refresh the stats display if the store changed since last update."""
+        store = self.app.store  # type: ignore
+        if store.version == self._last_version:
+            return
+        self._last_version = store.version
+        for name, bar in self._stat_bars.items():
+            bar.value = store.get_stat(name)
+            bar.refresh()
+        if store.inventory_version != self._seen_inv_version:
+            self._seen_inv_version = store.inventory_version
+            self._update_inventory_preview(store)
 
 
 class StatsScreen(Screen):
@@ -228,10 +281,15 @@ class StatsScreen(Screen):
                 store.update_stat(stat_name, -5)
             self._update_display()
     
+    def on_mount(self) -> None:
+        self._val_widgets = {
+            stat: self.query_one(f"#{stat}_val", Static)
+            for stat in ("hydration", "energy", "urination", "stress")
+        }
+    
     def _update_display(self) -> None:
         store = self.app.store  # type: ignore
-        for stat in ["hydration", "energy", "urination", "stress"]:
-            val_widget = self.query_one(f"#{stat}_val", Static)
+        for stat, val_widget in self._val_widgets.items():
             val_widget.update(f"[b]{store.get_stat(stat)}%[/b]")
 
 
@@ -288,15 +346,13 @@ class InventoryScreen(Screen):
             classes="inventory-screen"
         )
     
-    def _inventory_items(self) -> list:
+    def _inventory_lines(self) -> list:
         store = self.app.store  # type: ignore
-        items = store.inventory
-        if not items:
-            return [ListItem(Static("[dim]Empty[/dim]"))]
-        return [
-            ListItem(Static(f"{item['name']} [{item['category']}] x{item['quantity']}", classes="list-line"))
-            for item in items
-        ]
+        lines = [f"{name} [{category}] x{quantity}" for name, category, quantity, _ in store.inventory_rows()]
+        return lines or ["[dim]Empty[/dim]"]
+    
+    def _inventory_items(self) -> list:
+        return [ListItem(Static(line, classes="list-line")) for line in self._inventory_lines()]
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         btn_id = event.button.id
@@ -315,9 +371,9 @@ class InventoryScreen(Screen):
         store = self.app.store  # type: ignore
         if list_view.index is None:
             return None
-        items = store.inventory
-        if 0 <= list_view.index < len(items):
-            return items[list_view.index]["name"]
+        names = store.item_names
+        if 0 <= list_view.index < len(names):
+            return names[list_view.index]
         return None
     
     def action_view_item(self) -> None:
@@ -342,10 +398,17 @@ class InventoryScreen(Screen):
             self.app.push_screen(DeleteItemModal(selected))
     
     def refresh_inventory(self) -> None:
+        """Update existing rows in place; only add or remove the difference."""
         list_view = self.query_one("#inventory_list", ListView)
-        list_view.clear()
-        for item in self._inventory_items():
-            list_view.append(item)
+        lines = self._inventory_lines()
+        rows = list(list_view.children)
+        for row, line in zip(rows, lines):
+            row.query_one(Static).update(line)
+        for line in lines[len(rows):]:
+            list_view.append(ListItem(Static(line, classes="list-line")))
+        if len(rows) > len(lines):
+            # Go through ListView so the highlighted index stays valid
+            list_view.remove_items(range(len(lines), len(rows)))
 
 
 class ItemDetailScreen(Screen):
@@ -428,18 +491,20 @@ class ItemEditorModal(Screen):
         
         name = name_input.value.strip()
         category = category_input.value.strip() or "Uncategorized"
-        try:
-            quantity = int(quantity_input.value)
-        except ValueError:
-            quantity = 1
-        try:
-            weight = float(weight_input.value)
-        except ValueError:
-            weight = 0.0
+        quantity = _parse_int(quantity_input.value, 1)
+        weight = _parse_float(weight_input.value, 0.0)
         
         if name:
             if self.item_name:
-                store.update_item(self.item_name, name, category, quantity, weight)
+                edited = {"name": name, "category": category, "quantity": quantity, "weight": weight}
+                old = store.get_item(self.item_name)
+                # Saving without changes should not trigger a file write
+                if old != edited and not store.update_item(self.item_name, name, category, quantity, weight):
+                    if old is None:
+                        self.notify(f"{self.item_name} no longer exists", severity="error")
+                    else:
+                        self.notify(f"An item named {name} already exists", severity="error")
+                    return
             else:
                 store.add_item(name, category, quantity, weight)
             self.dismiss()
@@ -748,16 +813,31 @@ class WristDeviceApp(App):
     
     def __init__(self):
         super().__init__()
-        self.store = DataStore()
+        self.store = DataStore(scheduler=self.set_timer)
     
     def on_mount(self) -> None:
+        self._ticks = 0
+        self.set_interval(1, self._tick)
         self.push_screen("dashboard")
 
+    def _tick(self) -> None:
+        """Single 1Hz heartbeat driving the clock and dashboard refreshes."""
+        self._ticks += 1
+        screen = self.screen
+        for clock in screen.query(ClockDisplay):
+            clock.update_clock()
+        if self._ticks % 2 == 0 and isinstance(screen, DashboardScreen):
+            screen.refresh_stats()
+
     def action_switch_screen(self, screen_name: str) -> None:
         """Switch between named screens."""
         if screen_name in self.SCREENS:
             self.switch_screen(screen_name)
 
+    def on_unmount(self) -> None:
+        """Persist any pending auto-save however the app exits."""
+        self.store.flush()
+
     def action_quit(self) -> None:
         """Quit the application from any screen."""
         self.exit()